@@ -3,6 +3,7 @@
 生成可视化图表和详细分析报告
 """
 
+import os
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
@@ -13,6 +14,22 @@ import json
 plt.rcParams['font.sans-serif'] = ['SimHei', 'Arial Unicode MS', 'DejaVu Sans']
 plt.rcParams['axes.unicode_minus'] = False
 
+
+def _read_csv_cached(csv_file: str) -> pd.DataFrame:
+    """读取CSV，首次读取后在旁路缓存Parquet，后续走列式读取"""
+    parquet_file = csv_file + '.parquet'
+    if (os.path.exists(parquet_file) and
+            os.path.getmtime(parquet_file) >= os.path.getmtime(csv_file)):
+        return pd.read_parquet(parquet_file)
+
+    df = pd.read_csv(csv_file)
+    try:
+        df.to_parquet(parquet_file)
+    except Exception:
+        pass  # 缓存写失败不影响主流程
+    return df
+
+
 class CostAnalysisReport:
     """成本分析报告生成器"""
 
@@ -24,21 +41,19 @@ class CostAnalysisReport:
             driver_cost_file: 司机成本分析文件路径
             branch_summary_file: 分公司汇总文件路径
         """
-        self.driver_costs = pd.read_csv(driver_cost_file)
-        self.branch_summary = pd.read_csv(branch_summary_file)
+        self.driver_costs = _read_csv_cached(driver_cost_file)
+        self.branch_summary = _read_csv_cached(branch_summary_file)
 
-    def generate_cost_structure_chart(self, save_path: str = None):
+    def generate_cost_structure_chart(self, save_path: str = None, show: bool = True):
         """生成成本结构分析图表"""
-        # 计算总成本结构
-        total_mileage_cost = self.driver_costs['mileage_cost'].sum()
-        total_time_cost = self.driver_costs['time_cost'].sum()
-        total_fixed_cost = self.driver_costs['fixed_cost'].sum()
+        # 计算总成本结构（一次遍历得到三项合计）
+        sums = self.driver_costs[['mileage_cost', 'time_cost', 'fixed_cost']].sum()
 
-        costs = [total_mileage_cost, total_time_cost, total_fixed_cost]
+        costs = [sums['mileage_cost'], sums['time_cost'], sums['fixed_cost']]
         labels = ['里程成本', '时间成本', '固定成本']
         colors = ['#FF6B6B', '#4ECDC4', '#45B7D1']
 
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6), constrained_layout=True)
 
         # 饼图
         ax1.pie(costs, labels=labels, colors=colors, autopct='%1.1f%%', startangle=90)
@@ -50,18 +65,19 @@ class CostAnalysisReport:
         ax2.set_ylabel('成本 (元)')
 
         # 添加数值标签
-        for i, cost in enumerate(costs):
-            ax2.text(i, cost + 50, f'{cost:.1f}元', ha='center', va='bottom')
-
-        plt.tight_layout()
+        ax2.bar_label(ax2.containers[0], fmt='%.1f元', padding=3)
 
         if save_path:
             plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.show()
+        if show:
+            plt.show()
+        else:
+            plt.close(fig)
 
-    def generate_branch_comparison_chart(self, save_path: str = None):
+    def generate_branch_comparison_chart(self, save_path: str = None, show: bool = True):
         """生成分公司对比分析图表"""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12),
+                                                     constrained_layout=True)
 
         # 1. 各分公司总成本对比
         ax1.bar(self.branch_summary['branch_name'], self.branch_summary['总成本'],
@@ -107,15 +123,16 @@ class CostAnalysisReport:
         ax4.set_xticklabels(self.branch_summary['branch_name'], rotation=45)
         ax4.legend()
 
-        plt.tight_layout()
-
         if save_path:
             plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.show()
+        if show:
+            plt.show()
+        else:
+            plt.close(fig)
 
-    def generate_driver_performance_chart(self, save_path: str = None):
+    def generate_driver_performance_chart(self, save_path: str = None, show: bool = True):
         """生成司机绩效分析图表"""
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6), constrained_layout=True)
 
         # 1. 司机配送点数 vs 总成本
         scatter = ax1.scatter(self.driver_costs['delivery_points_count'],
@@ -143,57 +160,73 @@ class CostAnalysisReport:
                    label=f'平均值: {mean_cost:.1f}元')
         ax2.legend()
 
-        plt.tight_layout()
-
         if save_path:
             plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.show()
+        if show:
+            plt.show()
+        else:
+            plt.close(fig)
 
     def generate_summary_report(self) -> str:
         """生成文字总结报告"""
+        # 所有合计一次遍历算完，避免每个指标单独扫一遍全列
+        sums = self.driver_costs[[
+            'delivery_points_count', 'total_distance_km', 'total_cost',
+            'mileage_cost', 'fuel_cost', 'toll_cost', 'time_cost', 'fixed_cost'
+        ]].sum()
+        point_cost = self.driver_costs['avg_cost_per_point'].agg(
+            ['mean', 'min', 'max', 'std'])
+        total_cost = sums['total_cost']
+
         report = f"""
 # 2025-08-20 配送成本分析报告
 
 ## 📊 整体概况
 - **分析日期**: 2025年8月20日
 - **总司机数**: {len(self.driver_costs)}人
-- **总配送点数**: {self.driver_costs['delivery_points_count'].sum()}个
-- **总里程**: {self.driver_costs['total_distance_km'].sum():.2f}公里
-- **总成本**: {self.driver_costs['total_cost'].sum():.2f}元
+- **总配送点数**: {sums['delivery_points_count']:.0f}个
+- **总里程**: {sums['total_distance_km']:.2f}公里
+- **总成本**: {total_cost:.2f}元
 
 ## 💰 成本结构分析
-- **里程成本**: {self.driver_costs['mileage_cost'].sum():.2f}元 ({self.driver_costs['mileage_cost'].sum()/self.driver_costs['total_cost'].sum()*100:.1f}%)
-  - 燃油成本: {self.driver_costs['fuel_cost'].sum():.2f}元
-  - 过路费: {self.driver_costs['toll_cost'].sum():.2f}元
-- **时间成本**: {self.driver_costs['time_cost'].sum():.2f}元 ({self.driver_costs['time_cost'].sum()/self.driver_costs['total_cost'].sum()*100:.1f}%)
-- **固定成本**: {self.driver_costs['fixed_cost'].sum():.2f}元 ({self.driver_costs['fixed_cost'].sum()/self.driver_costs['total_cost'].sum()*100:.1f}%)
+- **里程成本**: {sums['mileage_cost']:.2f}元 ({sums['mileage_cost']/total_cost*100:.1f}%)
+  - 燃油成本: {sums['fuel_cost']:.2f}元
+  - 过路费: {sums['toll_cost']:.2f}元
+- **时间成本**: {sums['time_cost']:.2f}元 ({sums['time_cost']/total_cost*100:.1f}%)
+- **固定成本**: {sums['fixed_cost']:.2f}元 ({sums['fixed_cost']/total_cost*100:.1f}%)
 
 ## 🏢 分公司表现排名
 
 ### 成本效率最优 (元/公里)
 """
-        # 按成本效率排序
+        # 按成本效率排序（zip整列取值，名次从1起而非沿用原行号）
         efficiency_ranking = self.branch_summary.sort_values('成本效率')
-        for i, row in efficiency_ranking.iterrows():
-            report += f"{row.name + 1}. {row['branch_name']}: {row['成本效率']:.2f}元/公里\n"
+        report += '\n'.join(
+            f"{rank}. {branch}: {eff:.2f}元/公里"
+            for rank, (branch, eff) in enumerate(
+                zip(efficiency_ranking['branch_name'], efficiency_ranking['成本效率']), 1)
+        ) + '\n'
 
         report += f"""
 ### 配送规模最大 (配送点数)
 """
         # 按配送点数排序
         scale_ranking = self.branch_summary.sort_values('配送点总数', ascending=False)
-        for i, row in scale_ranking.iterrows():
-            report += f"{i + 1}. {row['branch_name']}: {row['配送点总数']}个配送点\n"
+        report += '\n'.join(
+            f"{rank}. {branch}: {points}个配送点"
+            for rank, (branch, points) in enumerate(
+                zip(scale_ranking['branch_name'], scale_ranking['配送点总数']), 1)
+        ) + '\n'
 
         report += f"""
 ## 🚚 司机绩效分析
-- **平均单点成本**: {self.driver_costs['avg_cost_per_point'].mean():.2f}元/点
-- **最低单点成本**: {self.driver_costs['avg_cost_per_point'].min():.2f}元/点
-- **最高单点成本**: {self.driver_costs['avg_cost_per_point'].max():.2f}元/点
-- **成本标准差**: {self.driver_costs['avg_cost_per_point'].std():.2f}元
+- **平均单点成本**: {point_cost['mean']:.2f}元/点
+- **最低单点成本**: {point_cost['min']:.2f}元/点
+- **最高单点成本**: {point_cost['max']:.2f}元/点
+- **成本标准差**: {point_cost['std']:.2f}元
 
 ## 📈 关键发现
-1. **固定成本占比过高**: 固定成本占总成本的{self.driver_costs['fixed_cost'].sum()/self.driver_costs['total_cost'].sum()*100:.1f}%，说明需要提高配送密度来摊薄固定成本
+1. **固定成本占比过高**: 固定成本占总成本的{sums['fixed_cost']/total_cost*100:.1f}%，说明需要提高配送密度来摊薄固定成本
 2. **分公司效率差异显著**: 最优与最差分公司的成本效率相差{efficiency_ranking['成本效率'].max()/efficiency_ranking['成本效率'].min():.1f}倍
 3. **里程与成本相关性**: 配送里程是影响成本的主要因素之一
 
@@ -213,10 +246,14 @@ class CostAnalysisReport:
         import os
         os.makedirs(output_dir, exist_ok=True)
 
+        # 批量出图：用Agg后端直接落盘，跳过plt.show()的交互渲染
+        import matplotlib
+        matplotlib.use('Agg')
+
         # 生成图表
-        self.generate_cost_structure_chart(f"{output_dir}/成本结构分析.png")
-        self.generate_branch_comparison_chart(f"{output_dir}/分公司对比分析.png")
-        self.generate_driver_performance_chart(f"{output_dir}/司机绩效分析.png")
+        self.generate_cost_structure_chart(f"{output_dir}/成本结构分析.png", show=False)
+        self.generate_branch_comparison_chart(f"{output_dir}/分公司对比分析.png", show=False)
+        self.generate_driver_performance_chart(f"{output_dir}/司机绩效分析.png", show=False)
 
         # 保存文字报告
         report_text = self.generate_summary_report()
@@ -6,10 +6,86 @@
 import pandas as pd
 import numpy as np
 import math
+import os
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
 import json
 
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    numba = None
+    HAS_NUMBA = False
+
+try:
+    import polars as pl
+    HAS_POLARS = True
+except ImportError:
+    pl = None
+    HAS_POLARS = False
+
+
+def _trajectory_distances_py(lat, lon, depot_lat, depot_lon,
+                             group_starts, group_ends):
+    """纯Python后备实现：逐司机累加路径距离（numba不可用时使用）"""
+    R = 6371.0
+    n_groups = len(group_starts)
+    totals = np.zeros(n_groups)
+    for g in range(n_groups):
+        start, end = group_starts[g], group_ends[g]
+        # 坐标可为float32，但三角运算须在float64中进行：
+        # 1-cos(Δlat)在相邻点极近时会发生灾难性抵消
+        prev_lon = np.float64(depot_lon[g])
+        lat1 = math.radians(np.float64(depot_lat[g]))
+        clat1, slat1 = math.cos(lat1), math.sin(lat1)
+        total = 0.0
+        for i in range(start, end):
+            lat2 = math.radians(np.float64(lat[i]))
+            clat2, slat2 = math.cos(lat2), math.sin(lat2)
+            dlon = math.radians(np.float64(lon[i]) - prev_lon)
+            clat_prod = clat1 * clat2
+            a = 0.5 * (1 - (clat_prod + slat1 * slat2)) \
+                + clat_prod * math.sin(dlon/2)**2
+            a = min(max(a, 0.0), 1.0)
+            total += R * 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
+            clat1, slat1, prev_lon = clat2, slat2, np.float64(lon[i])
+        totals[g] = total
+    return totals
+
+
+if HAS_NUMBA:
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _trajectory_distances(lat, lon, depot_lat, depot_lon,
+                              group_starts, group_ends):  # pragma: no cover
+        """numba并行核：对拼接后的坐标数组按司机分组累加路径距离"""
+        R = 6371.0
+        n_groups = len(group_starts)
+        totals = np.zeros(n_groups)
+        for g in numba.prange(n_groups):
+            start, end = group_starts[g], group_ends[g]
+            # 坐标可为float32，但三角运算须在float64中进行：
+            # 1-cos(Δlat)在相邻点极近时会发生灾难性抵消
+            prev_lon = np.float64(depot_lon[g])
+            lat1 = math.radians(np.float64(depot_lat[g]))
+            clat1, slat1 = math.cos(lat1), math.sin(lat1)
+            total = 0.0
+            for i in range(start, end):
+                lat2 = math.radians(np.float64(lat[i]))
+                clat2, slat2 = math.cos(lat2), math.sin(lat2)
+                dlon = math.radians(np.float64(lon[i]) - prev_lon)
+                clat_prod = clat1 * clat2
+                a = 0.5 * (1 - (clat_prod + slat1 * slat2)) \
+                    + clat_prod * math.sin(dlon/2)**2
+                a = min(max(a, 0.0), 1.0)
+                total += R * 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
+                clat1, slat1, prev_lon = clat2, slat2, np.float64(lon[i])
+            totals[g] = total
+        return totals
+else:
+    _trajectory_distances = _trajectory_distances_py
+
+
 class DeliveryCostCalculator:
     """配送成本计算器"""
 
@@ -60,12 +136,48 @@ class DeliveryCostCalculator:
         distance = R * c
         return distance
 
-    def analyze_driver_trajectory(self, driver_data: pd.DataFrame) -> Dict:
+    @staticmethod
+    def haversine_path(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+        """
+        计算一条折线上相邻点之间的Haversine距离
+
+        路径上每个点同时作为一段的终点和下一段的起点，这里对每个点
+        只算一次sin/cos（利用cos(Δlat)的和角展开），比对每段独立
+        套用Haversine公式少一半三角函数。
+
+        Args:
+            lats, lons: 路径点的纬度和经度数组（含起点）
+
+        Returns:
+            相邻点间的距离数组（公里），长度为len(lats)-1
+        """
+        R = 6371.0
+
+        lat_rad = np.radians(lats)
+        clat = np.cos(lat_rad)
+        slat = np.sin(lat_rad)
+        dlon = np.radians(np.diff(lons))
+
+        # sin²(Δlat/2) = (1 - cos(Δlat))/2，cos(Δlat)用缓存的cos/sin展开
+        clat_prod = clat[:-1] * clat[1:]
+        a = 0.5 * (1 - (clat_prod + slat[:-1] * slat[1:])) \
+            + clat_prod * np.sin(dlon/2)**2
+        a = np.clip(a, 0.0, 1.0)
+
+        return R * 2 * np.arctan2(np.sqrt(a), np.sqrt(1-a))
+
+    def analyze_driver_trajectory(self, driver_data: pd.DataFrame,
+                                  total_distance: Optional[float] = None,
+                                  collect_path: bool = False) -> Dict:
         """
         分析单个司机的配送轨迹
 
         Args:
             driver_data: 单个司机的打卡数据（已按时间排序）
+            total_distance: 预先算好的路径总距离（公里），
+                            批量处理时由numba核一次性计算后传入
+            collect_path: 是否构建逐段路径明细；成本计算只需总距离，
+                          仅地图/报表等需要展示路线时才传True
 
         Returns:
             轨迹分析结果字典
@@ -82,63 +194,58 @@ class DeliveryCostCalculator:
         depot_lat = driver_data['匹配纬度'].iloc[0]
         depot_lon = driver_data['匹配经度'].iloc[0]
 
-        # 按时间排序构建配送路径
-        sorted_data = driver_data.sort_values('提交时间')
-
-        # 提取配送点坐标
-        delivery_points = []
-        for _, row in sorted_data.iterrows():
-            delivery_points.append({
-                'lat': row['纬度'],
-                'lon': row['经度'],
-                'time': row['提交时间'],
-                'address': row['送货地址'],
-                'store_name': row.get('收货方名称', ''),
-            })
-
-        # 计算路径总距离
-        total_distance = 0
-        path_details = []
+        # 批量管线已按(司机, 时间)全局排好序，单独调用时才需要兜底排序
+        if driver_data['提交时间'].is_monotonic_increasing:
+            sorted_data = driver_data
+        else:
+            sorted_data = driver_data.sort_values('提交时间', kind='stable')
+
+        # 整列提取配送点信息（SoA结构，避免逐行iterrows装箱开销）
+        lat = sorted_data['纬度'].to_numpy()
+        lon = sorted_data['经度'].to_numpy()
+        times = sorted_data['提交时间'].to_numpy()
+        addresses = sorted_data['送货地址'].to_numpy(object)
+        if '收货方名称' in sorted_data.columns:
+            stores = sorted_data['收货方名称'].to_numpy(object)
+        else:
+            stores = np.full(len(sorted_data), '', dtype=object)
+
+        delivery_points = {
+            'lats': lat,
+            'lons': lon,
+            'times': times,
+            'addresses': addresses,
+            'stores': stores,
+        }
 
-        # 仓库到第一个配送点
-        if delivery_points:
-            first_point = delivery_points[0]
-            distance = self.haversine_distance(
-                depot_lat, depot_lon,
-                first_point['lat'], first_point['lon']
-            )
-            total_distance += distance
-            path_details.append({
-                'from': '仓库',
-                'to': f"配送点1",
-                'distance': distance,
-                'from_coords': (depot_lat, depot_lon),
-                'to_coords': (first_point['lat'], first_point['lon'])
-            })
-
-        # 配送点之间的距离
-        for i in range(1, len(delivery_points)):
-            prev_point = delivery_points[i-1]
-            curr_point = delivery_points[i]
-
-            distance = self.haversine_distance(
-                prev_point['lat'], prev_point['lon'],
-                curr_point['lat'], curr_point['lon']
-            )
-            total_distance += distance
-            path_details.append({
-                'from': f"配送点{i}",
-                'to': f"配送点{i+1}",
-                'distance': distance,
-                'from_coords': (prev_point['lat'], prev_point['lon']),
-                'to_coords': (curr_point['lat'], curr_point['lon'])
-            })
-
-        # 计算配送时长
-        if len(delivery_points) >= 2:
-            start_time = pd.to_datetime(delivery_points[0]['time'])
-            end_time = pd.to_datetime(delivery_points[-1]['time'])
-            delivery_duration_hours = (end_time - start_time).total_seconds() / 3600
+        path_lat = np.concatenate([[depot_lat], lat])
+        path_lon = np.concatenate([[depot_lon], lon])
+        leg_distances = self.haversine_path(path_lat, path_lon)
+        from_lat, from_lon = path_lat[:-1], path_lon[:-1]
+        if total_distance is None:
+            total_distance = float(leg_distances.sum())
+
+        # 路径明细只在显式要求时构建（热路径上是纯GC压力）
+        path_details = []
+        if collect_path:
+            for i, distance in enumerate(leg_distances):
+                path_details.append({
+                    'from': '仓库' if i == 0 else f"配送点{i}",
+                    'to': f"配送点{i+1}",
+                    'distance': float(distance),
+                    'from_coords': (from_lat[i], from_lon[i]),
+                    'to_coords': (lat[i], lon[i])
+                })
+
+        # 计算配送时长（已是datetime64时直接相减，不再重复解析）
+        if len(times) >= 2:
+            if np.issubdtype(times.dtype, np.datetime64):
+                delivery_duration_hours = float(
+                    (times[-1] - times[0]) / np.timedelta64(1, 'h'))
+            else:
+                start_time = pd.to_datetime(times[0])
+                end_time = pd.to_datetime(times[-1])
+                delivery_duration_hours = (end_time - start_time).total_seconds() / 3600
         else:
             delivery_duration_hours = 0.5  # 默认30分钟
 
@@ -147,7 +254,7 @@ class DeliveryCostCalculator:
             'delivery_date': delivery_date,
             'branch_name': branch_name,
             'depot_coords': (depot_lat, depot_lon),
-            'delivery_points_count': len(delivery_points),
+            'delivery_points_count': len(lat),
             'total_distance_km': round(total_distance, 2),
             'delivery_duration_hours': round(delivery_duration_hours, 2),
             'path_details': path_details,
@@ -181,17 +288,15 @@ class DeliveryCostCalculator:
         # 时间成本计算
         time_cost = delivery_duration * self.cost_params['driver_hourly_wage']
 
-        # 固定成本（按配送点数量分摊）
+        # 固定成本（按天计，不随配送点数变化）
         points_count = trajectory_analysis['delivery_points_count']
         if points_count > 0:
-            fixed_cost_per_delivery = (
+            fixed_cost_total = (
                 self.cost_params['vehicle_depreciation'] +
                 self.cost_params['insurance_daily']
-            ) / max(points_count, 1)  # 避免除零
+            )
         else:
-            fixed_cost_per_delivery = 0
-
-        fixed_cost_total = fixed_cost_per_delivery * points_count
+            fixed_cost_total = 0.0
 
         # 总成本
         total_cost = mileage_cost + time_cost + fixed_cost_total
@@ -216,37 +321,310 @@ class DeliveryCostCalculator:
             'cost_efficiency': round(total_cost / max(total_distance, 0.1), 2)  # 元/公里
         }
 
-    def process_daily_data(self, data_file: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    def _aggregate_trajectories(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        处理每日配送数据，生成司机成本分析和分公司汇总
+        向量化聚合所有司机的轨迹统计（距离、时长、配送点数）
+
+        Args:
+            df: 预处理后的打卡数据
+
+        Returns:
+            每司机一行的轨迹统计DataFrame
+        """
+        # 空输入提前返回：分组边界推导会对零行数据凭空造出
+        # group_starts=[0]，距离核按起点索引仓库坐标时越界
+        if len(df) == 0:
+            return pd.DataFrame(columns=[
+                'driver_id', 'delivery_date', 'branch_name',
+                'delivery_points_count', 'total_distance_km',
+                'delivery_duration_hours'])
+
+        # 全局排序后一次性计算所有司机的路径距离（numba并行核）
+        # 稳定排序：时间戳相同的打卡保持原始顺序，结果可复现
+        df = df.sort_values(['微信open_id', '提交时间'], kind='stable')
+        ids = df['微信open_id']
+        if isinstance(ids.dtype, pd.CategoricalDtype):
+            # category列直接比较整数编码找分组边界，不做字符串哈希
+            codes = ids.cat.codes.to_numpy()
+            group_starts = np.flatnonzero(
+                np.r_[True, codes[1:] != codes[:-1]])
+        else:
+            _, group_starts = np.unique(ids.to_numpy(), return_index=True)
+            group_starts = np.sort(group_starts)
+        group_ends = np.append(group_starts[1:], len(df))
+
+        # GPS坐标float32精度约1米，远低于直线距离本身的误差，
+        # 半宽的元素让SIMD通道数翻倍；累加仍在float64中进行
+        distances = _trajectory_distances(
+            df['纬度'].to_numpy(dtype=np.float32),
+            df['经度'].to_numpy(dtype=np.float32),
+            df['匹配纬度'].to_numpy(dtype=np.float32)[group_starts],
+            df['匹配经度'].to_numpy(dtype=np.float32)[group_starts],
+            group_starts, group_ends
+        )
+
+        # 其余统计量用一次groupby.agg完成（分组顺序与np.unique一致；
+        # observed=True只留实际出现的司机，category列在dropna后可能
+        # 带着空类别，留着会与按观测行算出的distances错位）
+        stats = df.groupby('微信open_id', sort=True, observed=True).agg(
+            delivery_date=('提交日期', 'first'),
+            branch_name=('匹配分公司名', 'first'),
+            delivery_points_count=('纬度', 'size'),
+            start_time=('提交时间', 'min'),
+            end_time=('提交时间', 'max'),
+        )
+        stats['total_distance_km'] = np.round(distances, 2)
+
+        # 配送时长：提交时间已在读入时解析为datetime64，直接相减；
+        # 仅一个配送点时取默认30分钟
+        duration_hours = (
+            stats['end_time'] - stats['start_time']
+        ).dt.total_seconds() / 3600
+        stats['delivery_duration_hours'] = np.round(
+            np.where(stats['delivery_points_count'] >= 2, duration_hours, 0.5), 2
+        )
+
+        stats = stats.drop(columns=['start_time', 'end_time'])
+        stats.index.name = 'driver_id'
+        return stats.reset_index()
+
+    def _costs_from_stats(self, stats: pd.DataFrame) -> pd.DataFrame:
+        """
+        基于轨迹统计批量计算各项成本（整列向量化表达式）
+
+        Args:
+            stats: _aggregate_trajectories的输出
+
+        Returns:
+            司机成本分析DataFrame
+        """
+        distance = stats['total_distance_km']
+        duration = stats['delivery_duration_hours']
+        points = stats['delivery_points_count']
+
+        fuel_cost = distance * (
+            self.cost_params['fuel_price'] *
+            self.cost_params['fuel_consumption'] / 100
+        )
+        toll_cost = distance * self.cost_params['toll_rate']
+        mileage_cost = fuel_cost + toll_cost
+        time_cost = duration * self.cost_params['driver_hourly_wage']
+        fixed_cost = np.where(
+            points > 0,
+            self.cost_params['vehicle_depreciation'] + self.cost_params['insurance_daily'],
+            0.0
+        )
+        total_cost = mileage_cost + time_cost + fixed_cost
+
+        return pd.DataFrame({
+            'driver_id': stats['driver_id'],
+            'delivery_date': stats['delivery_date'],
+            'branch_name': stats['branch_name'],
+            'total_distance_km': distance,
+            'delivery_duration_hours': duration,
+            'delivery_points_count': points,
+            'fuel_cost': fuel_cost.round(2),
+            'toll_cost': toll_cost.round(2),
+            'mileage_cost': mileage_cost.round(2),
+            'time_cost': time_cost.round(2),
+            'fixed_cost': np.round(fixed_cost, 2),
+            'total_cost': total_cost.round(2),
+            'avg_cost_per_point': (total_cost / points.clip(lower=1)).round(2),
+            'cost_efficiency': (total_cost / distance.clip(lower=0.1)).round(2),
+        })
+
+    def _aggregate_trajectories_lazy(self, lf: 'pl.LazyFrame') -> pd.DataFrame:
+        """
+        Polars惰性管线：去空、排序、分组聚合一次完成
+
+        Haversine距离写成Polars表达式（shift().over()取每司机前一点，
+        首行回填仓库坐标），查询优化器可将各步融合为单次数据遍历。
+
+        Args:
+            lf: 原始打卡数据的LazyFrame
+
+        Returns:
+            每司机一行的轨迹统计DataFrame（pandas，供下游复用）
+        """
+        R = 6371.0
+        prev_lat = pl.col('纬度').shift(1).over('微信open_id').fill_null(pl.col('匹配纬度'))
+        prev_lon = pl.col('经度').shift(1).over('微信open_id').fill_null(pl.col('匹配经度'))
+
+        lat1 = prev_lat.radians()
+        lat2 = pl.col('纬度').radians()
+        dlat = lat2 - lat1
+        dlon = (pl.col('经度') - prev_lon).radians()
+        a = (dlat / 2).sin() ** 2 + lat1.cos() * lat2.cos() * (dlon / 2).sin() ** 2
+        leg_km = 2 * R * pl.arctan2(a.sqrt(), (1 - a).sqrt())
+
+        stats = (
+            lf
+            .drop_nulls(['微信open_id', '经度', '纬度', '匹配经度', '匹配纬度'])
+            .with_columns(pl.col('提交时间').str.to_datetime())
+            .sort(['微信open_id', '提交时间'], maintain_order=True)
+            .with_columns(leg_km.alias('leg_km'))
+            .group_by('微信open_id', maintain_order=True)
+            .agg([
+                pl.col('提交时间').dt.date().first().alias('delivery_date'),
+                pl.col('匹配分公司名').first().cast(pl.String).alias('branch_name'),
+                pl.len().alias('delivery_points_count'),
+                pl.col('leg_km').sum().round(2).alias('total_distance_km'),
+                ((pl.col('提交时间').max() - pl.col('提交时间').min())
+                 .dt.total_seconds() / 3600).alias('duration_hours'),
+            ])
+            .with_columns(
+                pl.when(pl.col('delivery_points_count') >= 2)
+                .then(pl.col('duration_hours'))
+                .otherwise(0.5)
+                .round(2)
+                .alias('delivery_duration_hours')
+            )
+            .drop('duration_hours')
+            .rename({'微信open_id': 'driver_id'})
+            .collect()
+        )
+        return stats.to_pandas()
+
+    # 轨迹统计缓存：成本参数不影响轨迹，多次调参只需重算成本
+    _trajectory_cache: Dict[Tuple[str, float], pd.DataFrame] = {}
+
+    # 管线实际用到的列及类型：只读这些列可大幅减少解析和内存开销，
+    # id/分公司用category让groupby直接走整数编码
+    _USECOLS = ['微信open_id', '提交时间', '经度', '纬度', '送货地址',
+                '收货方名称', '匹配经度', '匹配纬度', '匹配分公司名']
+    _DTYPE_MAP = {
+        '微信open_id': 'category',
+        '匹配分公司名': 'category',
+        '经度': 'float64',
+        '纬度': 'float64',
+        '匹配经度': 'float64',
+        '匹配纬度': 'float64',
+    }
+
+    def _compute_trajectories(self, data_file: str) -> pd.DataFrame:
+        """
+        读取打卡数据并聚合轨迹统计，按(文件路径, 修改时间)缓存
+
+        首次读取CSV后在旁路写出Parquet文件，后续读取走类型化的
+        列式格式，省去重复的字符串解析。
 
         Args:
             data_file: 数据文件路径
 
         Returns:
-            (司机成本分析DataFrame, 分公司汇总DataFrame)
+            每司机一行的轨迹统计DataFrame
+        """
+        cache_key = (os.path.abspath(data_file), os.path.getmtime(data_file))
+        cached = self._trajectory_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        parquet_file = data_file + '.parquet'
+        use_parquet = (
+            os.path.exists(parquet_file) and
+            os.path.getmtime(parquet_file) >= os.path.getmtime(data_file)
+        )
+
+        if HAS_POLARS:
+            if use_parquet:
+                lf = pl.scan_parquet(parquet_file)
+            else:
+                # polars分组基于哈希，id保持字符串即可；分公司列用
+                # Categorical省内存，出边界时再转回字符串
+                lf = pl.read_csv(
+                    data_file,
+                    columns=self._USECOLS,
+                    schema_overrides={
+                        '匹配分公司名': pl.Categorical,
+                        '经度': pl.Float64,
+                        '纬度': pl.Float64,
+                        '匹配经度': pl.Float64,
+                        '匹配纬度': pl.Float64,
+                    },
+                )
+                try:
+                    lf.write_parquet(parquet_file)
+                except Exception:
+                    pass  # 缓存写失败不影响主流程
+                lf = lf.lazy()
+            stats = self._aggregate_trajectories_lazy(lf)
+        else:
+            # pandas后备路径
+            if use_parquet:
+                df = pd.read_parquet(parquet_file)
+            else:
+                df = pd.read_csv(data_file, usecols=self._USECOLS,
+                                 dtype=self._DTYPE_MAP)
+                try:
+                    df.to_parquet(parquet_file)
+                except Exception:
+                    pass  # 缓存写失败不影响主流程
+            # 时间戳只解析一次，后续排序/聚合复用datetime64列
+            df['提交时间'] = pd.to_datetime(df['提交时间'])
+            df['提交日期'] = df['提交时间'].dt.date
+            df = df.dropna(subset=['微信open_id', '经度', '纬度', '匹配经度', '匹配纬度'])
+            stats = self._aggregate_trajectories(df)
+
+        self._trajectory_cache[cache_key] = stats
+        return stats
+
+    # 参数矩阵的列顺序（敏感性扫描用）
+    _PARAM_KEYS = ('fuel_price', 'fuel_consumption', 'toll_rate',
+                   'driver_hourly_wage', 'vehicle_depreciation', 'insurance_daily')
+
+    def sweep_cost_parameters(self, data_file: str,
+                              scenarios: List[Dict]) -> np.ndarray:
         """
-        # 读取数据
-        df = pd.read_csv(data_file)
+        对多组成本参数做敏感性扫描
+
+        轨迹统计只计算一次，各情景的成本通过参数矩阵一次广播得出，
+        不再按情景重复读取数据。
+
+        Args:
+            data_file: 数据文件路径
+            scenarios: 完整成本参数字典的列表，每个即一个情景
+
+        Returns:
+            (司机数, 情景数) 的总成本矩阵
+        """
+        stats = self._compute_trajectories(data_file)
+        distance = stats['total_distance_km'].to_numpy()[:, None]
+        duration = stats['delivery_duration_hours'].to_numpy()[:, None]
+        points = stats['delivery_points_count'].to_numpy()[:, None]
+
+        # (情景数, 6) 参数矩阵
+        params = np.array([[s[k] for k in self._PARAM_KEYS] for s in scenarios])
+
+        mileage_cost = distance * (params[:, 0] * params[:, 1] / 100 + params[:, 2])
+        time_cost = duration * params[:, 3]
+        fixed_cost = np.where(points > 0, params[:, 4] + params[:, 5], 0.0)
 
-        # 数据预处理
-        df['提交日期'] = pd.to_datetime(df['提交时间']).dt.date
-        df = df.dropna(subset=['微信open_id', '经度', '纬度', '匹配经度', '匹配纬度'])
+        return (mileage_cost + time_cost + fixed_cost).round(2)
 
-        # 按司机分组分析
-        driver_results = []
+    # 完整结果缓存：键为(文件路径, 修改时间, 成本参数)，
+    # 同一数据同一参数的重复调用直接返回
+    _result_cache: Dict[Tuple, Tuple[pd.DataFrame, pd.DataFrame]] = {}
 
-        for driver_id, driver_data in df.groupby('微信open_id'):
-            # 分析司机轨迹
-            trajectory = self.analyze_driver_trajectory(driver_data)
-            if trajectory:
-                # 计算成本
-                cost_analysis = self.calculate_delivery_cost(trajectory)
-                if cost_analysis:
-                    driver_results.append(cost_analysis)
+    def process_daily_data(self, data_file: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        处理每日配送数据，生成司机成本分析和分公司汇总
+
+        Args:
+            data_file: 数据文件路径
+
+        Returns:
+            (司机成本分析DataFrame, 分公司汇总DataFrame)
+        """
+        cache_key = (
+            os.path.abspath(data_file), os.path.getmtime(data_file),
+            tuple(self.cost_params.get(k) for k in self._PARAM_KEYS),
+        )
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-        # 创建司机成本分析DataFrame
-        driver_cost_df = pd.DataFrame(driver_results)
+        stats = self._compute_trajectories(data_file)
+        driver_cost_df = self._costs_from_stats(stats)
 
         # 生成分公司汇总
         if not driver_cost_df.empty:
@@ -268,6 +646,7 @@ class DeliveryCostCalculator:
         else:
             branch_summary = pd.DataFrame()
 
+        self._result_cache[cache_key] = (driver_cost_df, branch_summary)
         return driver_cost_df, branch_summary
 
     def save_cost_parameters(self, file_path: str):
@@ -6,11 +6,10 @@
 2. 运行应用：python run_app.py
 """
 
+import importlib.util
 import subprocess
 import sys
 import os
-import webbrowser
-import time
 from pathlib import Path
 
 def check_dependencies():
@@ -20,12 +19,11 @@ def check_dependencies():
         'plotly', 'pandas', 'numpy'
     ]
 
-    missing_packages = []
-    for package in required_packages:
-        try:
-            __import__(package.replace('-', '_'))
-        except ImportError:
-            missing_packages.append(package)
+    # find_spec只查找不导入，省去streamlit等重型包的初始化时间
+    missing_packages = [
+        package for package in required_packages
+        if importlib.util.find_spec(package.replace('-', '_')) is None
+    ]
 
     if missing_packages:
         print("❌ 缺少以下依赖包:")
@@ -75,25 +73,18 @@ def start_streamlit():
 
     print("✅ 所有检查通过，启动Web应用...")
 
-    # 启动Streamlit
+    # 启动Streamlit（浏览器由streamlit在服务就绪后自动打开，
+    # 不再自己起线程sleep+webbrowser，避免抢跑或开出重复标签页）
     try:
         cmd = [sys.executable, "-m", "streamlit", "run", "streamlit_app.py",
-               "--server.port", "8501"]
+               "--server.port", "8501",
+               "--server.headless", "false",
+               "--browser.gatherUsageStats", "false"]
 
         print("🌐 Web应用将在浏览器中打开...")
         print("📍 本地访问地址: http://localhost:8501")
         print("⏹️  按 Ctrl+C 停止应用")
 
-        # 等待一下再打开浏览器
-        def open_browser():
-            time.sleep(3)
-            webbrowser.open('http://localhost:8501')
-
-        import threading
-        browser_thread = threading.Thread(target=open_browser)
-        browser_thread.daemon = True
-        browser_thread.start()
-
         # 运行Streamlit
         subprocess.run(cmd)
 
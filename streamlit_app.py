@@ -9,14 +9,18 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import folium
-from streamlit_folium import st_folium
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import csv
+import io
 import json
 from delivery_cost_calculator import DeliveryCostCalculator
 
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    numba = None
+    HAS_NUMBA = False
+
 # 页面配置
 st.set_page_config(
     page_title="司机配送成本分析系统",
@@ -57,9 +61,35 @@ def load_data():
     """加载数据"""
     try:
         # 使用相对路径直接读取数据文件
-        original_data = pd.read_csv('data/2025-08-20_打卡_已匹配.csv', encoding='utf-8-sig')
-        driver_costs = pd.read_csv('data/2025-08-20_司机成本分析.csv', encoding='utf-8-sig')
-        branch_summary = pd.read_csv('data/2025-08-20_分公司汇总.csv', encoding='utf-8-sig')
+        # pyarrow引擎多线程解析CSV并自动吃掉BOM；dtype_backend用Arrow
+        # 列存，中文字符串列内存约减半，后续groupby也更快
+        original_data = pd.read_csv('data/2025-08-20_打卡_已匹配.csv',
+                                    engine='pyarrow', dtype_backend='pyarrow')
+        driver_costs = pd.read_csv('data/2025-08-20_司机成本分析.csv',
+                                   engine='pyarrow', dtype_backend='pyarrow')
+        branch_summary = pd.read_csv('data/2025-08-20_分公司汇总.csv',
+                                     engine='pyarrow', dtype_backend='pyarrow')
+        # 时间戳在加载时解析一次（指定format走C快路径），
+        # load_data有缓存，滑块rerun不再重复解析字符串
+        original_data['提交时间'] = pd.to_datetime(
+            original_data['提交时间'], format='%Y-%m-%d %H:%M:%S', cache=True)
+        original_data['提交日期'] = original_data['提交时间'].dt.date
+        # 坐标列降到float32：距离核内部本就按float32算，这里提前
+        # 降一半内存，后续过滤/切片搬运的数据量也减半（GPS本身的
+        # 抖动远大于float32在经纬度上约1米的精度损失）
+        for col in ['经度', '纬度', '匹配经度', '匹配纬度']:
+            original_data[col] = original_data[col].astype('float32')
+        # 低基数字符串列转category：groupby/比较走整数编码，
+        # unique()直接取类别表而不是全列哈希
+        for col in ['微信open_id', '匹配分公司名', '收货方名称']:
+            original_data[col] = original_data[col].astype('category')
+        # 司机成本表的分公司列同样低基数（driver_id每行唯一，
+        # 转category反而多存一张码表，保持原样）
+        driver_costs['branch_name'] = driver_costs['branch_name'].astype('category')
+        # 全局按(司机,时间)预排序一次：下游逐司机切片天然有序，
+        # 地图不用再每个子帧各排一遍，聚合管线的排序也能走捷径
+        original_data = original_data.sort_values(
+            ['微信open_id', '提交时间'], kind='stable').reset_index(drop=True)
         return original_data, driver_costs, branch_summary
     except FileNotFoundError as e:
         st.error(f"数据文件未找到: {e}")
@@ -73,14 +103,17 @@ def load_data():
         return None, None, None
 
 
+@st.cache_data(show_spinner=False)
 def generate_comprehensive_csv_report(driver_costs, branch_summary, cost_params):
     """生成综合分析报告CSV"""
     report_data = []
 
-    # 整体统计
-    total_cost = driver_costs['total_cost'].sum()
-    total_distance = driver_costs['total_distance_km'].sum()
-    total_points = driver_costs['delivery_points_count'].sum()
+    # 六项合计对列块一次归约，不再逐列各扫一遍
+    sums = driver_costs[['total_cost', 'total_distance_km', 'delivery_points_count',
+                         'mileage_cost', 'time_cost', 'fixed_cost']].sum()
+    total_cost = sums['total_cost']
+    total_distance = sums['total_distance_km']
+    total_points = int(sums['delivery_points_count'])
 
     report_data.append(['整体统计', '', ''])
     report_data.append(['总司机数', len(driver_costs), '人'])
@@ -91,9 +124,9 @@ def generate_comprehensive_csv_report(driver_costs, branch_summary, cost_params)
     report_data.append(['', '', ''])
 
     # 成本结构
-    mileage_cost = driver_costs['mileage_cost'].sum()
-    time_cost = driver_costs['time_cost'].sum()
-    fixed_cost = driver_costs['fixed_cost'].sum()
+    mileage_cost = sums['mileage_cost']
+    time_cost = sums['time_cost']
+    fixed_cost = sums['fixed_cost']
 
     report_data.append(['成本结构分析', '', ''])
     report_data.append(['里程成本', f"{mileage_cost:.2f}", f"{mileage_cost/total_cost*100:.1f}%"])
@@ -101,16 +134,19 @@ def generate_comprehensive_csv_report(driver_costs, branch_summary, cost_params)
     report_data.append(['固定成本', f"{fixed_cost:.2f}", f"{fixed_cost/total_cost*100:.1f}%"])
     report_data.append(['', '', ''])
 
-    # 分公司效率排名
+    # 分公司效率排名（zip整列取值，不走iterrows的逐行Series装箱）
     report_data.append(['分公司效率排名', '', ''])
     efficiency_ranking = branch_summary.sort_values('成本效率')
-    for i, (_, row) in enumerate(efficiency_ranking.iterrows(), 1):
-        report_data.append([f"第{i}名", row['branch_name'], f"{row['成本效率']:.2f}元/公里"])
+    for i, (name, eff) in enumerate(zip(efficiency_ranking['branch_name'],
+                                        efficiency_ranking['成本效率']), 1):
+        report_data.append([f"第{i}名", name, f"{eff:.2f}元/公里"])
     report_data.append(['', '', ''])
 
-    # 司机绩效
-    best_driver = driver_costs.loc[driver_costs['avg_cost_per_point'].idxmin()]
-    worst_driver = driver_costs.loc[driver_costs['avg_cost_per_point'].idxmax()]
+    # 司机绩效：单点成本取一次数组后argmin/argmax定位，
+    # 不再idxmin/idxmax各扫一遍再按标签取行
+    point_costs = driver_costs['avg_cost_per_point'].to_numpy()
+    best_driver = driver_costs.iloc[point_costs.argmin()]
+    worst_driver = driver_costs.iloc[point_costs.argmax()]
 
     report_data.append(['司机绩效分析', '', ''])
     report_data.append(['最高效司机', best_driver['driver_id'][-8:], f"{best_driver['avg_cost_per_point']:.2f}元/点"])
@@ -127,10 +163,16 @@ def generate_comprehensive_csv_report(driver_costs, branch_summary, cost_params)
     report_data.append(['车辆日折旧', cost_params['vehicle_depreciation'], '元'])
     report_data.append(['日保险费', cost_params['insurance_daily'], '元'])
 
-    # 转换为CSV格式
-    df_report = pd.DataFrame(report_data, columns=['指标', '数值', '单位'])
-    return df_report.to_csv(index=False, encoding='utf-8-sig')
+    # 几十行的小报表直接csv.writer写进StringIO，
+    # 不再为此构造DataFrame走to_csv；带BOM让Excel按UTF-8打开
+    buf = io.StringIO()
+    buf.write('\ufeff')
+    writer = csv.writer(buf, lineterminator='\n')
+    writer.writerow(['指标', '数值', '单位'])
+    writer.writerows(report_data)
+    return buf.getvalue()
 
+@st.cache_data(show_spinner=False)
 def generate_comparison_report(old_driver_costs, new_driver_costs, old_params, new_params):
     """生成参数对比分析报告"""
     comparison_data = []
@@ -164,19 +206,46 @@ def generate_comparison_report(old_driver_costs, new_driver_costs, old_params, n
         'insurance_daily': '日保险费'
     }
 
-    for key, name in param_names.items():
-        old_val = old_params[key]
-        new_val = new_params[key]
-        if old_val != new_val:
-            change = new_val - old_val
-            change_pct = (change / old_val) * 100
-            comparison_data.append([name, f"{old_val}", f"{new_val}", f"{change:+.2f}", f"{change_pct:+.1f}%"])
+    # 差值/百分比整批向量化算完，再用掩码只保留有变化的参数行；
+    # 显示仍取原字典标量，整数参数不会被数组转换带上小数点
+    keys = list(param_names)
+    old_vals = np.array([old_params[k] for k in keys], dtype=np.float64)
+    new_vals = np.array([new_params[k] for k in keys], dtype=np.float64)
+    changes = new_vals - old_vals
+    change_pcts = np.divide(changes, old_vals, out=np.zeros_like(changes),
+                            where=old_vals != 0) * 100
+    for idx in np.flatnonzero(old_vals != new_vals):
+        key = keys[idx]
+        comparison_data.append([param_names[key], f"{old_params[key]}", f"{new_params[key]}",
+                                f"{changes[idx]:+.2f}", f"{change_pcts[idx]:+.1f}%"])
+
+    buf = io.StringIO()
+    buf.write('\ufeff')
+    writer = csv.writer(buf, lineterminator='\n')
+    writer.writerow(['项目', '调整前', '调整后', '变化量', '变化率'])
+    writer.writerows(comparison_data)
+    return buf.getvalue()
+
+@st.cache_resource
+def _get_libs():
+    """按需导入重型可视化库并常驻缓存
+
+    streamlit每次交互都重跑整个脚本，顶层导入会让不看地图的
+    rerun也付导入成本；cache_resource把命名空间对象钉在服务端
+    进程生命周期里，rerun时连sys.modules属性链查找都省掉。
+    """
+    from types import SimpleNamespace
+    import folium
+    from folium import plugins
+    import plotly.express as px
+    import plotly.graph_objects as go
+    return SimpleNamespace(folium=folium, plugins=plugins, px=px, go=go)
 
-    df_comparison = pd.DataFrame(comparison_data, columns=['项目', '调整前', '调整后', '变化量', '变化率'])
-    return df_comparison.to_csv(index=False, encoding='utf-8-sig')
 
 def create_route_map(original_data, selected_drivers=None, map_style="标准地图", show_heatmap=False):
     """创建司机配送路径地图"""
+    libs = _get_libs()
+    folium, plugins = libs.folium, libs.plugins
     if selected_drivers is None:
         selected_drivers = original_data['微信open_id'].unique()
 
@@ -216,19 +285,35 @@ def create_route_map(original_data, selected_drivers=None, map_style="标准地
 
     driver_color_map = {}
 
+    # 点位很多时改用FastMarkerCluster：整个司机的坐标打包成一个JS数组
+    # 由浏览器端聚合，HTML体积比逐点CircleMarker小一个量级；
+    # 点位少时仍用CircleMarker保留逐点popup详情
+    use_cluster = len(filtered_data) > 300
+
+    # 一次groupby切好每个司机的子帧：K次整列等值扫描(O(K·N))
+    # 变成一趟分组(O(N))后按司机直接取
+    driver_groups = dict(iter(filtered_data.groupby('微信open_id',
+                                                    observed=True, sort=False)))
+
     for i, driver_id in enumerate(selected_drivers):
-        driver_data = filtered_data[filtered_data['微信open_id'] == driver_id].sort_values('提交时间')
+        driver_data = driver_groups.get(driver_id)
 
-        if len(driver_data) == 0:
+        if driver_data is None or len(driver_data) == 0:
             continue
 
+        # load_data已全局按(司机,时间)预排序，子帧通常天然有序；
+        # 仅对外部传入的未排序数据兜底补排
+        if not driver_data['提交时间'].is_monotonic_increasing:
+            driver_data = driver_data.sort_values('提交时间')
+
         color = colors[i % len(colors)]
         driver_color_map[driver_id] = color
 
-        # 获取分公司信息
-        branch_name = driver_data['匹配分公司名'].iloc[0]
-        depot_lat = driver_data['匹配纬度'].iloc[0]
-        depot_lon = driver_data['匹配经度'].iloc[0]
+        # 获取分公司信息（首行取一次，不再三列各做一次标量定位）
+        first_row = driver_data.iloc[0]
+        branch_name = first_row['匹配分公司名']
+        depot_lat = first_row['匹配纬度']
+        depot_lon = first_row['匹配经度']
 
         # 添加仓库标记
         folium.Marker(
@@ -238,25 +323,38 @@ def create_route_map(original_data, selected_drivers=None, map_style="标准地
             icon=folium.Icon(color='black', icon='home'),
         ).add_to(m)
 
-        # 配送路径点
-        coordinates = []
-        coordinates.append([depot_lat, depot_lon])  # 起点
-
-        for idx, row in driver_data.iterrows():
-            lat, lon = row['纬度'], row['经度']
-            coordinates.append([lat, lon])
+        # 整列提取为数组后zip迭代，不走iterrows的逐行Series装箱；
+        # tooltip时间批量用dt.strftime格式化
+        lats = driver_data['纬度'].to_numpy()
+        lons = driver_data['经度'].to_numpy()
+        time_strs = driver_data['提交时间'].astype(str).to_numpy()
+        tooltips = driver_data['提交时间'].dt.strftime('%H:%M').fillna('未知时间').to_numpy()
+        addrs = driver_data['送货地址'].to_numpy()
+
+        # 配送路径点（仓库起点 + 整列坐标一次拼出）
+        coordinates = [[depot_lat, depot_lon]] + np.column_stack([lats, lons]).tolist()
+
+        if use_cluster:
+            plugins.FastMarkerCluster(
+                np.column_stack([lats, lons]).tolist(),
+                name=f"司机 {driver_id[-8:]}"
+            ).add_to(m)
+            point_rows = []
+        else:
+            point_rows = zip(lats, lons, time_strs, tooltips, addrs)
 
+        for lat, lon, t, tip, addr in point_rows:
             # 添加配送点标记
             folium.CircleMarker(
                 [lat, lon],
                 radius=6,
                 popup=f"""
                 司机: {driver_id[-8:]}<br>
-                时间: {row['提交时间']}<br>
-                地址: {row['送货地址']}<br>
+                时间: {t}<br>
+                地址: {addr}<br>
                 分公司: {branch_name}
                 """,
-                tooltip=f"配送点 - {pd.to_datetime(row['提交时间']).strftime('%H:%M') if pd.notna(row['提交时间']) else '未知时间'}",
+                tooltip=f"配送点 - {tip}",
                 color=color,
                 fillColor=color,
                 fillOpacity=0.7
@@ -274,10 +372,8 @@ def create_route_map(original_data, selected_drivers=None, map_style="标准地
 
     # 添加热力图（如果启用）
     if show_heatmap and len(filtered_data) > 0:
-        from folium import plugins
-        heatmap_data = []
-        for _, row in filtered_data.iterrows():
-            heatmap_data.append([row['纬度'], row['经度']])
+        # 坐标整列一次转成嵌套列表，不走iterrows逐行攒小列表
+        heatmap_data = filtered_data[['纬度', '经度']].to_numpy().tolist()
 
         plugins.HeatMap(
             heatmap_data,
@@ -292,7 +388,6 @@ def create_route_map(original_data, selected_drivers=None, map_style="标准地
     folium.LayerControl(position='topright').add_to(m)
 
     # 添加全屏插件
-    from folium import plugins
     plugins.Fullscreen(position='topleft').add_to(m)
 
     # 添加鼠标位置显示
@@ -300,18 +395,82 @@ def create_route_map(original_data, selected_drivers=None, map_style="标准地
 
     return m
 
+@st.cache_data(show_spinner=False)
+def _load_default_params():
+    """读取默认成本参数并缓存，文件缺失时退回内置默认值
+
+    Returns:
+        (参数字典, 是否使用了内置默认值)
+    """
+    try:
+        with open('data/cost_parameters.json', 'r', encoding='utf-8') as f:
+            return json.load(f), False
+    except Exception:
+        return {
+            "fuel_price": 7.5,
+            "fuel_consumption": 8.0,
+            "toll_rate": 0.45,
+            "driver_hourly_wage": 25,
+            "vehicle_depreciation": 150,
+            "insurance_daily": 50,
+        }, True
+
+
+@st.cache_data(show_spinner=False)
+def _branch_driver_ids(selected_branch):
+    """返回某分公司下的司机id列表（'全部'返回全体），按分公司缓存"""
+    original_data, _, _ = load_data()
+    if selected_branch != '全部':
+        original_data = original_data[original_data['匹配分公司名'] == selected_branch]
+    return original_data['微信open_id'].unique().tolist()
+
+
+def _params_key(params):
+    """成本参数的规整化比较键
+
+    浮点统一按4位小数取整后排序成元组：滑块步进带来的
+    浮点漂移不会被误判成"参数已修改"而触发整条重算。
+    """
+    return tuple((k, round(float(v), 4)) for k, v in sorted(params.items()))
+
+
+@st.cache_data(show_spinner=False)
+def _df_to_csv_bytes(df):
+    """DataFrame序列化为带BOM的CSV字节并缓存
+
+    download_button的data参数每次rerun都会被求值，几万行的表
+    不该每次都重新to_csv；直接给bytes还能省一次编码。
+    """
+    return df.to_csv(index=False).encode('utf-8-sig')
+
+
+@st.cache_resource(max_entries=16)
+def _cached_route_map(driver_ids, map_style, show_heatmap):
+    """按(司机选择, 地图样式, 热力图开关)缓存构建好的地图对象
+
+    打卡数据本身来自已缓存的load_data，在别的标签页操作控件
+    触发rerun时，同一组选择直接复用上次的folium.Map。
+    """
+    original_data, _, _ = load_data()
+    return create_route_map(original_data, list(driver_ids), map_style, show_heatmap)
+
+
+@st.cache_data(show_spinner=False)
 def create_cost_charts(driver_costs, branch_summary):
     """创建成本分析图表"""
+    libs = _get_libs()
+    px, go = libs.px, libs.go
     charts = {}
 
+    # 三项成本合计对连续二维切片一次归约（而不是三次整列扫描）；
+    # 效率排序只做一次，给用到它的图共用
+    cost_sums = driver_costs[['mileage_cost', 'time_cost', 'fixed_cost']].sum().to_numpy()
+    branch_sorted = branch_summary.sort_values('成本效率')
+
     # 1. 成本结构饼图
     fig_pie = go.Figure(data=[go.Pie(
         labels=['里程成本', '时间成本', '固定成本'],
-        values=[
-            driver_costs['mileage_cost'].sum(),
-            driver_costs['time_cost'].sum(),
-            driver_costs['fixed_cost'].sum()
-        ],
+        values=cost_sums,
         hole=0.3,
         marker_colors=['#FF6B6B', '#4ECDC4', '#45B7D1']
     )])
@@ -329,29 +488,45 @@ def create_cost_charts(driver_costs, branch_summary):
         y='总成本',
         color='成本效率',
         title="各分公司总成本对比",
-        color_continuous_scale='RdYlBu_r',
-        text='总成本'
+        color_continuous_scale='RdYlBu_r'
     )
-    fig_branch.update_traces(texttemplate='%{text:.0f}元', textposition='outside')
+    # 数值标签直接取y值，省掉text列的一次数据传递
+    fig_branch.update_traces(texttemplate='%{y:.0f}元', textposition='outside')
     fig_branch.update_layout(height=400)
     charts['branch_comparison'] = fig_branch
 
-    # 3. 司机绩效散点图
-    fig_scatter = px.scatter(
-        driver_costs,
-        x='delivery_points_count',
-        y='total_cost',
-        color='branch_name',
-        size='total_distance_km',
-        hover_data=['avg_cost_per_point'],
-        title="司机绩效分析：配送点数 vs 总成本"
-    )
+    # 3. 司机绩效散点图。司机数很大时逐点marker的前端渲染会明显
+    # 变慢，超过阈值改为histogram2d预聚合成密度热图：图元数量
+    # 只跟分箱数有关，与司机数无关
+    if len(driver_costs) > 2000:
+        hist, x_edges, y_edges = np.histogram2d(
+            driver_costs['delivery_points_count'].to_numpy(dtype=np.float64),
+            driver_costs['total_cost'].to_numpy(dtype=np.float64),
+            bins=60)
+        fig_scatter = go.Figure(go.Heatmap(
+            z=hist.T, x=x_edges, y=y_edges, colorscale='Viridis',
+            colorbar=dict(title='司机数')))
+        fig_scatter.update_layout(
+            title="司机绩效分析：配送点数 vs 总成本（密度）",
+            xaxis_title='delivery_points_count',
+            yaxis_title='total_cost'
+        )
+    else:
+        fig_scatter = px.scatter(
+            driver_costs,
+            x='delivery_points_count',
+            y='total_cost',
+            color='branch_name',
+            size='total_distance_km',
+            hover_data=['avg_cost_per_point'],
+            title="司机绩效分析：配送点数 vs 总成本"
+        )
     fig_scatter.update_layout(height=400)
     charts['driver_performance'] = fig_scatter
 
     # 4. 成本效率对比
     fig_efficiency = px.bar(
-        branch_summary.sort_values('成本效率'),
+        branch_sorted,
         x='成本效率',
         y='branch_name',
         orientation='h',
@@ -364,47 +539,333 @@ def create_cost_charts(driver_costs, branch_summary):
 
     return charts
 
-def recalculate_costs(original_data, cost_params):
-    """根据新参数重新计算成本"""
-    calculator = DeliveryCostCalculator(cost_params)
+@st.cache_data(show_spinner=False)
+def recalculate_costs(cost_params):
+    """根据新参数重新计算成本
 
-    # 重新处理数据
-    df = original_data.copy()
-    df['提交日期'] = pd.to_datetime(df['提交时间']).dt.date
-    df = df.dropna(subset=['微信open_id', '经度', '纬度', '匹配经度', '匹配纬度'])
+    缓存键只由参数字典构成，滑块来回拖到同一组参数时直接命中，
+    不再重算；打卡数据在函数内取自已缓存的load_data（与
+    _cached_route_map同款写法），不作为入参参与哈希，省掉每次
+    rerun对几千行数据做内容哈希的开销。
+    """
+    original_data, _, _ = load_data()
+    calculator = DeliveryCostCalculator(cost_params)
 
-    # 按司机分组分析
-    driver_results = []
-    for driver_id, driver_data in df.groupby('微信open_id'):
-        trajectory = calculator.analyze_driver_trajectory(driver_data)
-        if trajectory:
-            cost_analysis = calculator.calculate_delivery_cost(trajectory)
-            if cost_analysis:
-                driver_results.append(cost_analysis)
+    # dropna本身就返回新对象，直接在缓存数据上做即可，
+    # 不再先整帧copy（提交时间/提交日期已在load_data解析好）
+    df = original_data.dropna(subset=['微信open_id', '经度', '纬度', '匹配经度', '匹配纬度'])
 
-    new_driver_costs = pd.DataFrame(driver_results)
+    # 走计算器的批量管线：全局排序一次+numba并行距离核
+    # （_trajectory_distances，无numba时退回纯Python实现）
+    # +单次groupby.agg，不再逐司机调analyze_driver_trajectory
+    stats = calculator._aggregate_trajectories(df)
+    new_driver_costs = calculator._costs_from_stats(stats)
 
-    # 生成分公司汇总
+    # 生成分公司汇总：司机只有几十个、分公司只有几个，
+    # factorize成整数编码后用bincount直接算和/均值，
+    # 跳过pandas多reducer字典agg的通用机制
     if not new_driver_costs.empty:
-        new_branch_summary = new_driver_costs.groupby('branch_name').agg({
-            'driver_id': 'count',
-            'total_distance_km': ['sum', 'mean'],
-            'delivery_points_count': 'sum',
-            'total_cost': ['sum', 'mean'],
-            'avg_cost_per_point': 'mean',
-            'cost_efficiency': 'mean'
-        }).round(2)
-
-        new_branch_summary.columns = [
-            '司机数量', '总里程', '平均里程', '配送点总数',
-            '总成本', '平均成本', '平均单点成本', '成本效率'
-        ]
-        new_branch_summary = new_branch_summary.reset_index()
+        codes, branches = pd.factorize(new_driver_costs['branch_name'], sort=True)
+        counts = np.bincount(codes)
+
+        def _branch_sum(col):
+            return np.bincount(codes, weights=new_driver_costs[col].to_numpy())
+
+        dist_sum = _branch_sum('total_distance_km')
+        cost_sum = _branch_sum('total_cost')
+        new_branch_summary = pd.DataFrame({
+            'branch_name': branches,
+            '司机数量': counts,
+            '总里程': dist_sum.round(2),
+            '平均里程': (dist_sum / counts).round(2),
+            '配送点总数': _branch_sum('delivery_points_count').astype(np.int64),
+            '总成本': cost_sum.round(2),
+            '平均成本': (cost_sum / counts).round(2),
+            '平均单点成本': (_branch_sum('avg_cost_per_point') / counts).round(2),
+            '成本效率': (_branch_sum('cost_efficiency') / counts).round(2),
+        })
     else:
         new_branch_summary = pd.DataFrame()
 
     return new_driver_costs, new_branch_summary
 
+# tab5的静态说明文案提升为模块常量：streamlit每次交互都重跑脚本，
+# 常量在导入时构建一次，rerun时main()不再重新组装这些大段字符串
+_METHOD_STARTPOINT_MD = """
+            #### 🎯 起点识别算法
+            **多维度权重分析：**
+            - **时间分析法** (40%)：当日首次打卡位置
+            - **频率分析法** (35%)：多日重复出现位置
+            - **地址匹配法** (15%)：包含分公司关键词
+            - **GPS聚类法** (10%)：坐标聚类中心点
+
+            **算法流程：**
+            1. 提取司机每日首次打卡点
+            2. 统计多日重复位置频率
+            3. 匹配地址关键词（分公司名称）
+            4. 对坐标进行DBSCAN聚类
+            5. 综合权重计算最可能起点
+            """
+
+_METHOD_ROUTE_MD = """
+            #### 🚚 路径重建方法
+            **路径规划策略：**
+            - **时间排序**：按GPS打卡时间顺序
+            - **距离优化**：最短路径算法
+            - **异常处理**：过滤>200km跳跃点
+
+            **高德API集成：**
+            - 端点：`/v3/direction/driving`
+            - 参数：起点、终点经纬度
+            - 返回：实际行驶距离、预估时间
+            - 批量处理：支持多点路径规划
+
+            **数据验证：**
+            - GPS坐标有效性检查
+            - 时间戳合理性验证
+            - 距离异常值检测
+            """
+
+_METHOD_ADDRESS_MD = """
+            #### 🏢 智能地址匹配
+            **匹配规则：**
+            - **关键词库**：赣州、章贡、永州、冷水滩、株洲、吉安、衡阳、郴州、北湖
+            - **模糊匹配**：支持地址字符串包含匹配
+            - **优先级排序**：精确匹配 > 关键词匹配 > 距离匹配
+
+            **处理流程：**
+            1. 提取送货地址关键词
+            2. 与分公司地区名匹配
+            3. 计算地理距离辅助验证
+            4. 生成匹配置信度分数
+            5. 输出最佳匹配结果
+
+            **质量控制：**
+            - 匹配成功率统计
+            - 人工审核机制
+            - 异常地址标记
+            """
+
+_ARCH_FLOW_MD = """
+            #### 📊 数据处理流程
+            ```
+            原始CSV数据
+                ↓
+            数据清洗与验证
+                ↓
+            GPS坐标标准化
+                ↓
+            按司机+日期分组
+                ↓
+            起点识别算法
+                ↓
+            路径重建与优化
+                ↓
+            高德API距离计算
+                ↓
+            成本计算与分析
+                ↓
+            报告生成与可视化
+            ```
+
+            **关键技术：**
+            - pandas：数据处理
+            - numpy：数值计算
+            - sklearn：聚类算法
+            - requests：API调用
+            - streamlit：Web界面
+            - folium：地图可视化
+            - plotly：图表分析
+            """
+
+_ARCH_PERF_MD = """
+            #### ⚡ 性能优化策略
+            **数据处理优化：**
+            - 分批处理大型CSV文件
+            - 内存映射读取机制
+            - 并行计算距离矩阵
+            - 缓存中间计算结果
+
+            **API调用优化：**
+            - 批量请求减少调用次数
+            - 异步并发提高吞吐量
+            - 智能重试机制
+            - 结果缓存避免重复计算
+
+            **用户体验优化：**
+            - 响应式页面设计
+            - 实时参数调整
+            - 进度条显示
+            - 错误友好提示
+
+            **可扩展性设计：**
+            - 模块化代码架构
+            - 配置文件外置
+            - 插件式算法扩展
+            - 多数据源适配
+            """
+
+_QUALITY_RULES_MD = """
+            #### ✅ 数据验证规则
+            **GPS数据质量检查：**
+            - 经纬度范围验证（中国境内）
+            - 坐标精度检查（小数点位数）
+            - 时间戳连续性验证
+            - 异常跳跃距离检测（>200km）
+
+            **业务逻辑验证：**
+            - 司机ID唯一性检查
+            - 配送时间合理性（工作时间内）
+            - 地址格式标准化
+            - 分公司匹配完整性
+
+            **数据完整性统计：**
+            - 缺失值比例：< 5%
+            - 异常值比例：< 2%
+            - 匹配成功率：> 95%
+            - 数据覆盖度：17名司机，6个分公司
+            """
+
+_QUALITY_ACCURACY_MD = """
+            #### 🎯 准确性评估
+            **距离计算准确性：**
+            - 高德地图API：行业标准精度
+            - 实际测试误差：< 5%
+            - 路况实时更新
+            - 多路径方案对比
+
+            **成本计算可靠性：**
+            - 基于市场实际价格
+            - 定期参数更新机制
+            - 多维度交叉验证
+            - 历史数据对比分析
+
+            **算法验证方法：**
+            - 小样本人工验证
+            - 与传统方法对比
+            - 专家经验校验
+            - 实际业务反馈调优
+
+            **持续改进机制：**
+            - 月度数据质量报告
+            - 用户反馈收集
+            - 算法性能监控
+            - 版本迭代优化
+            """
+
+_EXAMPLE_INTRO_MD = """
+            **假设某司机配送数据：**
+            - 配送里程：50公里
+            - 配送时长：4小时
+            - 配送点数：8个
+
+            **成本计算过程：**
+            """
+
+# 示例七步的模板在导入时定义一次，渲染时format_map一次填入，
+# 不再每次rerun重走十几个f-string的FORMAT_VALUE
+_EXAMPLE_TEMPLATE = """
+    1. **燃油成本** = 50 × 8 ÷ 100 × {fuel_price} = {fuel:.2f}元
+    2. **过路费** = 50 × {toll_rate} = {toll:.2f}元
+    3. **里程成本** = {fuel:.2f} + {toll:.2f} = {mileage:.2f}元
+    4. **时间成本** = 4 × {wage} = {time:.2f}元
+    5. **固定成本** = {depreciation} + {insurance} = {fixed:.2f}元
+    6. **总成本** = {mileage:.2f} + {time:.2f} + {fixed:.2f} = {total:.2f}元
+    7. **单点成本** = {total:.2f} ÷ 8 = {per_point:.2f}元/点
+    """
+
+
+if HAS_NUMBA:
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _compute_costs_nb(distance, hours, points, per_km, hourly_wage,
+                          fixed, out):
+        """numba并行核：单循环融合全部乘加，不产生NumPy中间数组"""
+        for i in numba.prange(distance.shape[0]):
+            out[i] = (distance[i] * per_km + hours[i] * hourly_wage
+                      + fixed) / points[i]
+
+
+def compute_costs(distance, hours, points, params):
+    """向量化的单点成本核：对等长一维数组按行算(总成本/配送点数)
+
+    (燃油单价×油耗/100+过路费率)先折成单个每公里标量，热循环里
+    每元素只剩一次乘加；示例块用长度1的数组调用，后续对整批
+    司机行复用同一核。大批量(>1024行)切换numba并行核，小输入
+    走NumPy避免JIT预热开销。
+    """
+    distance = np.asarray(distance, dtype=np.float64)
+    hours = np.asarray(hours, dtype=np.float64)
+    points = np.asarray(points, dtype=np.float64)
+    per_km = (params['fuel_price'] * params['fuel_consumption'] / 100
+              + params['toll_rate'])
+    fixed = params['vehicle_depreciation'] + params['insurance_daily']
+    if HAS_NUMBA and distance.shape[0] > 1024:
+        out = np.empty_like(distance)
+        _compute_costs_nb(distance, hours, points, per_km,
+                          float(params['driver_hourly_wage']), fixed, out)
+        return out
+    total = distance * per_km + hours * params['driver_hourly_wage'] + fixed
+    return total / points
+
+
+@st.cache_data(show_spinner=False)
+def _compute_example(fuel_price, fuel_consumption, toll_rate,
+                     driver_hourly_wage, vehicle_depreciation, insurance_daily):
+    """示例场景（50公里/4小时/8个点）的各项成本，按参数元组缓存"""
+    example_distance = 50
+    example_hours = 4
+    example_points = 8
+
+    fuel_cost = (example_distance * fuel_consumption / 100) * fuel_price
+    toll_cost = example_distance * toll_rate
+    mileage_cost = fuel_cost + toll_cost
+    time_cost = example_hours * driver_hourly_wage
+    fixed_cost = vehicle_depreciation + insurance_daily
+    total_cost = mileage_cost + time_cost + fixed_cost
+    # 单点成本走向量化核（长度1数组），与批量路径共用同一公式
+    cost_per_point = float(compute_costs(
+        [example_distance], [example_hours], [example_points],
+        {'fuel_price': fuel_price, 'fuel_consumption': fuel_consumption,
+         'toll_rate': toll_rate, 'driver_hourly_wage': driver_hourly_wage,
+         'vehicle_depreciation': vehicle_depreciation,
+         'insurance_daily': insurance_daily})[0])
+    return (fuel_cost, toll_cost, mileage_cost, time_cost,
+            fixed_cost, total_cost, cost_per_point)
+
+
+@st.fragment
+def _render_cost_example(new_params):
+    """参数示例计算块
+
+    唯一随成本参数变动的tab5内容。拆成@st.fragment后，
+    片段内的交互只重跑这一小段，不再连带周围的静态说明面板。
+    """
+    st.markdown("#### 📝 计算示例")
+    st.markdown(_EXAMPLE_INTRO_MD)
+
+    # 计算示例值（标量参数做键，滑块没动时直接取缓存元组）
+    (fuel_cost, toll_cost, mileage_cost, time_cost,
+     fixed_cost, total_cost, cost_per_point) = _compute_example(
+        new_params['fuel_price'], new_params['fuel_consumption'],
+        new_params['toll_rate'], new_params['driver_hourly_wage'],
+        new_params['vehicle_depreciation'], new_params['insurance_daily'])
+
+    st.markdown(_EXAMPLE_TEMPLATE.format_map({
+        'fuel_price': new_params['fuel_price'],
+        'toll_rate': new_params['toll_rate'],
+        'wage': new_params['driver_hourly_wage'],
+        'depreciation': new_params['vehicle_depreciation'],
+        'insurance': new_params['insurance_daily'],
+        'fuel': fuel_cost,
+        'toll': toll_cost,
+        'mileage': mileage_cost,
+        'time': time_cost,
+        'fixed': fixed_cost,
+        'total': total_cost,
+        'per_point': cost_per_point,
+    }))
+
+
 def main():
     # 主标题
     st.markdown('<h1 class="main-header">🚚 司机配送成本分析系统</h1>', unsafe_allow_html=True)
@@ -438,20 +899,9 @@ def main():
     st.sidebar.header("📊 成本参数调整")
     st.sidebar.markdown("调整以下参数可实时重新计算成本：")
 
-    # 加载默认参数
-    try:
-        with open('data/cost_parameters.json', 'r', encoding='utf-8') as f:
-            default_params = json.load(f)
-    except:
-        # 使用默认参数
-        default_params = {
-            "fuel_price": 7.5,
-            "fuel_consumption": 8.0,
-            "toll_rate": 0.45,
-            "driver_hourly_wage": 25,
-            "vehicle_depreciation": 150,
-            "insurance_daily": 50,
-        }
+    # 加载默认参数（缓存后每次rerun不再stat+读JSON文件）
+    default_params, used_builtin = _load_default_params()
+    if used_builtin:
         st.info("使用默认成本参数")
 
     # 参数输入控件
@@ -484,12 +934,12 @@ def main():
         "insurance_daily": insurance_daily,
     }
 
-    # 检查参数是否改变
-    params_changed = new_params != default_params
+    # 检查参数是否改变（规整化后再比，滑块浮点漂移不算改动）
+    params_changed = _params_key(new_params) != _params_key(default_params)
 
     if params_changed:
         st.sidebar.info("参数已修改，重新计算中...")
-        current_driver_costs, current_branch_summary = recalculate_costs(original_data, new_params)
+        current_driver_costs, current_branch_summary = recalculate_costs(new_params)
         st.sidebar.success("✅ 成本重新计算完成")
     else:
         current_driver_costs, current_branch_summary = driver_costs, branch_summary
@@ -503,28 +953,23 @@ def main():
         # 地图控制选项
         col1, col2, col3 = st.columns([2, 1, 1])
 
-        with col1:
-            available_drivers = original_data['微信open_id'].unique()
-            selected_drivers = st.multiselect(
-                "选择要显示的司机 (默认显示前5个)",
-                available_drivers,
-                default=available_drivers[:5],  # 默认显示前5个司机
-                format_func=lambda x: f"司机 {x[-8:]}"
-            )
-
         with col2:
-            # 分公司过滤
+            # 分公司过滤先选：司机候选列表只在选中分公司的切片上取，
+            # 不再全表unique后再回头按分公司交集过滤
             available_branches = original_data['匹配分公司名'].unique()
             selected_branch = st.selectbox(
                 "按分公司过滤",
                 ['全部'] + list(available_branches)
             )
 
-            if selected_branch != '全部':
-                branch_drivers = original_data[
-                    original_data['匹配分公司名'] == selected_branch
-                ]['微信open_id'].unique()
-                selected_drivers = [d for d in selected_drivers if d in branch_drivers]
+        with col1:
+            available_drivers = _branch_driver_ids(selected_branch)
+            selected_drivers = st.multiselect(
+                "选择要显示的司机 (默认显示前5个)",
+                available_drivers,
+                default=available_drivers[:5],  # 默认显示前5个司机
+                format_func=lambda x: f"司机 {x[-8:]}"
+            )
 
         with col3:
             # 地图样式选择
@@ -538,9 +983,13 @@ def main():
             show_heatmap = st.checkbox("显示配送密度热力图", value=False)
 
         if selected_drivers:
+            # 选中司机集合只建一次哈希集，后面isin直接用
+            sel_set = frozenset(selected_drivers)
+
             # 创建地图
-            route_map = create_route_map(original_data, selected_drivers, map_style, show_heatmap)
+            route_map = _cached_route_map(tuple(sorted(sel_set)), map_style, show_heatmap)
             if route_map:
+                from streamlit_folium import st_folium
                 st_folium(route_map, width=700, height=500)
 
                 # 添加地图功能说明
@@ -560,7 +1009,7 @@ def main():
                 # 显示选中司机的基本信息
                 st.subheader("选中司机信息")
                 selected_info = current_driver_costs[
-                    current_driver_costs['driver_id'].isin(selected_drivers)
+                    current_driver_costs['driver_id'].isin(sel_set)
                 ][['driver_id', 'branch_name', 'delivery_points_count', 'total_distance_km', 'total_cost']]
                 selected_info.columns = ['司机ID', '分公司', '配送点数', '总里程(km)', '总成本(元)']
                 st.dataframe(selected_info, width='stretch')
@@ -604,8 +1053,14 @@ def main():
                 delta=f"{avg_cost_per_point - driver_costs['avg_cost_per_point'].mean():.2f}元" if params_changed else None
             )
 
-        # 图表展示
-        charts = create_cost_charts(current_driver_costs, current_branch_summary)
+        # 图表展示：按参数签名存进session_state，签名没变时直接复用
+        # 上次的四张图，连cache_data对两个数据帧的哈希都省掉
+        charts_sig = _params_key(new_params)
+        if st.session_state.get('charts_sig') != charts_sig:
+            st.session_state['charts'] = create_cost_charts(
+                current_driver_costs, current_branch_summary)
+            st.session_state['charts_sig'] = charts_sig
+        charts = st.session_state['charts']
 
         col1, col2 = st.columns(2)
         with col1:
@@ -665,15 +1120,19 @@ def main():
             '里程成本(元)', '时间成本(元)', '固定成本(元)', '总成本(元)', '单点成本(元)'
         ]
 
-        display_df = display_data[display_columns].copy()
-        display_df.columns = column_names
+        # rename只换列标签，不像copy那样复制底层数据
+        display_df = display_data[display_columns].rename(
+            columns=dict(zip(display_columns, column_names)))
         st.dataframe(display_df, width='stretch')
 
-        # 下载按钮
-        csv = display_df.to_csv(index=False, encoding='utf-8-sig')
+        # 下载按钮：BOM+CSV一次写进BytesIO，直接给按钮字节，
+        # 省掉to_csv返回字符串后再由streamlit编码一遍
+        buf = io.BytesIO()
+        buf.write(b'\xef\xbb\xbf')
+        display_df.to_csv(buf, index=False, encoding='utf-8')
         st.download_button(
             label="下载当前数据",
-            data=csv,
+            data=buf.getvalue(),
             file_name=f"司机成本分析_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.csv",
             mime="text/csv"
         )
@@ -690,7 +1149,7 @@ def main():
 
             # 原始匹配数据
             try:
-                original_csv = original_data.to_csv(index=False, encoding='utf-8-sig')
+                original_csv = _df_to_csv_bytes(original_data)
                 st.download_button(
                     label="📋 原始打卡匹配数据",
                     data=original_csv,
@@ -702,7 +1161,7 @@ def main():
                 st.error("原始数据加载失败")
 
             # 司机成本分析数据
-            driver_csv = current_driver_costs.to_csv(index=False, encoding='utf-8-sig')
+            driver_csv = _df_to_csv_bytes(current_driver_costs)
             st.download_button(
                 label="💰 司机成本分析数据",
                 data=driver_csv,
@@ -712,7 +1171,7 @@ def main():
             )
 
             # 分公司汇总数据
-            branch_csv = current_branch_summary.to_csv(index=False, encoding='utf-8-sig')
+            branch_csv = _df_to_csv_bytes(current_branch_summary)
             st.download_button(
                 label="🏢 分公司汇总统计",
                 data=branch_csv,
@@ -872,39 +1331,8 @@ def main():
             })
             st.dataframe(params_df, width='stretch')
 
-            # 计算示例
-            st.markdown("#### 📝 计算示例")
-            st.markdown("""
-            **假设某司机配送数据：**
-            - 配送里程：50公里
-            - 配送时长：4小时
-            - 配送点数：8个
-
-            **成本计算过程：**
-            """)
-
-            example_distance = 50
-            example_hours = 4
-            example_points = 8
-
-            # 计算示例值
-            fuel_cost = (example_distance * new_params['fuel_consumption'] / 100) * new_params['fuel_price']
-            toll_cost = example_distance * new_params['toll_rate']
-            mileage_cost = fuel_cost + toll_cost
-            time_cost = example_hours * new_params['driver_hourly_wage']
-            fixed_cost = new_params['vehicle_depreciation'] + new_params['insurance_daily']
-            total_cost = mileage_cost + time_cost + fixed_cost
-            cost_per_point = total_cost / example_points
-
-            st.markdown(f"""
-            1. **燃油成本** = 50 × 8 ÷ 100 × {new_params['fuel_price']} = {fuel_cost:.2f}元
-            2. **过路费** = 50 × {new_params['toll_rate']} = {toll_cost:.2f}元
-            3. **里程成本** = {fuel_cost:.2f} + {toll_cost:.2f} = {mileage_cost:.2f}元
-            4. **时间成本** = 4 × {new_params['driver_hourly_wage']} = {time_cost:.2f}元
-            5. **固定成本** = {new_params['vehicle_depreciation']} + {new_params['insurance_daily']} = {fixed_cost:.2f}元
-            6. **总成本** = {mileage_cost:.2f} + {time_cost:.2f} + {fixed_cost:.2f} = {total_cost:.2f}元
-            7. **单点成本** = {total_cost:.2f} ÷ 8 = {cost_per_point:.2f}元/点
-            """)
+            # 计算示例（独立片段，见_render_cost_example）
+            _render_cost_example(new_params)
 
         # 方法说明部分
         st.markdown("---")
@@ -914,62 +1342,13 @@ def main():
         method_col1, method_col2, method_col3 = st.columns(3)
 
         with method_col1:
-            st.markdown("#### 🎯 起点识别算法")
-            st.markdown("""
-            **多维度权重分析：**
-            - **时间分析法** (40%)：当日首次打卡位置
-            - **频率分析法** (35%)：多日重复出现位置
-            - **地址匹配法** (15%)：包含分公司关键词
-            - **GPS聚类法** (10%)：坐标聚类中心点
-
-            **算法流程：**
-            1. 提取司机每日首次打卡点
-            2. 统计多日重复位置频率
-            3. 匹配地址关键词（分公司名称）
-            4. 对坐标进行DBSCAN聚类
-            5. 综合权重计算最可能起点
-            """)
+            st.markdown(_METHOD_STARTPOINT_MD)
 
         with method_col2:
-            st.markdown("#### 🚚 路径重建方法")
-            st.markdown("""
-            **路径规划策略：**
-            - **时间排序**：按GPS打卡时间顺序
-            - **距离优化**：最短路径算法
-            - **异常处理**：过滤>200km跳跃点
-
-            **高德API集成：**
-            - 端点：`/v3/direction/driving`
-            - 参数：起点、终点经纬度
-            - 返回：实际行驶距离、预估时间
-            - 批量处理：支持多点路径规划
-
-            **数据验证：**
-            - GPS坐标有效性检查
-            - 时间戳合理性验证
-            - 距离异常值检测
-            """)
+            st.markdown(_METHOD_ROUTE_MD)
 
         with method_col3:
-            st.markdown("#### 🏢 智能地址匹配")
-            st.markdown("""
-            **匹配规则：**
-            - **关键词库**：赣州、章贡、永州、冷水滩、株洲、吉安、衡阳、郴州、北湖
-            - **模糊匹配**：支持地址字符串包含匹配
-            - **优先级排序**：精确匹配 > 关键词匹配 > 距离匹配
-
-            **处理流程：**
-            1. 提取送货地址关键词
-            2. 与分公司地区名匹配
-            3. 计算地理距离辅助验证
-            4. 生成匹配置信度分数
-            5. 输出最佳匹配结果
-
-            **质量控制：**
-            - 匹配成功率统计
-            - 人工审核机制
-            - 异常地址标记
-            """)
+            st.markdown(_METHOD_ADDRESS_MD)
 
         # 技术架构说明
         st.markdown("---")
@@ -978,65 +1357,10 @@ def main():
         arch_col1, arch_col2 = st.columns(2)
 
         with arch_col1:
-            st.markdown("#### 📊 数据处理流程")
-            st.markdown("""
-            ```
-            原始CSV数据
-                ↓
-            数据清洗与验证
-                ↓
-            GPS坐标标准化
-                ↓
-            按司机+日期分组
-                ↓
-            起点识别算法
-                ↓
-            路径重建与优化
-                ↓
-            高德API距离计算
-                ↓
-            成本计算与分析
-                ↓
-            报告生成与可视化
-            ```
-
-            **关键技术：**
-            - pandas：数据处理
-            - numpy：数值计算
-            - sklearn：聚类算法
-            - requests：API调用
-            - streamlit：Web界面
-            - folium：地图可视化
-            - plotly：图表分析
-            """)
+            st.markdown(_ARCH_FLOW_MD)
 
         with arch_col2:
-            st.markdown("#### ⚡ 性能优化策略")
-            st.markdown("""
-            **数据处理优化：**
-            - 分批处理大型CSV文件
-            - 内存映射读取机制
-            - 并行计算距离矩阵
-            - 缓存中间计算结果
-
-            **API调用优化：**
-            - 批量请求减少调用次数
-            - 异步并发提高吞吐量
-            - 智能重试机制
-            - 结果缓存避免重复计算
-
-            **用户体验优化：**
-            - 响应式页面设计
-            - 实时参数调整
-            - 进度条显示
-            - 错误友好提示
-
-            **可扩展性设计：**
-            - 模块化代码架构
-            - 配置文件外置
-            - 插件式算法扩展
-            - 多数据源适配
-            """)
+            st.markdown(_ARCH_PERF_MD)
 
         # 数据质量说明
         st.markdown("---")
@@ -1045,54 +1369,10 @@ def main():
         quality_col1, quality_col2 = st.columns(2)
 
         with quality_col1:
-            st.markdown("#### ✅ 数据验证规则")
-            st.markdown("""
-            **GPS数据质量检查：**
-            - 经纬度范围验证（中国境内）
-            - 坐标精度检查（小数点位数）
-            - 时间戳连续性验证
-            - 异常跳跃距离检测（>200km）
-
-            **业务逻辑验证：**
-            - 司机ID唯一性检查
-            - 配送时间合理性（工作时间内）
-            - 地址格式标准化
-            - 分公司匹配完整性
-
-            **数据完整性统计：**
-            - 缺失值比例：< 5%
-            - 异常值比例：< 2%
-            - 匹配成功率：> 95%
-            - 数据覆盖度：17名司机，6个分公司
-            """)
+            st.markdown(_QUALITY_RULES_MD)
 
         with quality_col2:
-            st.markdown("#### 🎯 准确性评估")
-            st.markdown("""
-            **距离计算准确性：**
-            - 高德地图API：行业标准精度
-            - 实际测试误差：< 5%
-            - 路况实时更新
-            - 多路径方案对比
-
-            **成本计算可靠性：**
-            - 基于市场实际价格
-            - 定期参数更新机制
-            - 多维度交叉验证
-            - 历史数据对比分析
-
-            **算法验证方法：**
-            - 小样本人工验证
-            - 与传统方法对比
-            - 专家经验校验
-            - 实际业务反馈调优
-
-            **持续改进机制：**
-            - 月度数据质量报告
-            - 用户反馈收集
-            - 算法性能监控
-            - 版本迭代优化
-            """)
+            st.markdown(_QUALITY_ACCURACY_MD)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file